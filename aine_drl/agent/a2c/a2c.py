@@ -120,7 +120,7 @@ class A2C(Agent):
             
     def select_action_train(self, obs: torch.Tensor) -> ActionTensor:
         # feed forward 
-        pdparam, v_pred = self.network.forward(obs)
+        pdparam, v_pred = self.network(obs)
         
         # action sampling
         dist = self.policy.get_policy_distribution(pdparam)
@@ -134,7 +134,7 @@ class A2C(Agent):
         return action
     
     def select_action_inference(self, obs: torch.Tensor) -> ActionTensor:
-        pdparam, _ = self.network.forward(obs)
+        pdparam, _ = self.network(obs)
         dist = self.policy.get_policy_distribution(pdparam)
         return dist.sample()
             
@@ -170,7 +170,7 @@ class A2C(Agent):
         """
         with torch.no_grad():
             final_next_obs = exp_batch.next_obs[-self.num_envs:]
-            _, final_next_v_pred = self.network.forward(final_next_obs)
+            _, final_next_v_pred = self.network(final_next_obs)
         
         v_pred = torch.cat([exp_batch.v_pred.detach(), final_next_v_pred])
         
@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple
+from typing import Dict, Tuple, Union
 from aine_drl.experience import Action, ActionTensor, Experience
 from aine_drl.network import Network
 from aine_drl.policy.policy import Policy
 import aine_drl.util as util
-from aine_drl.drl_util import Clock, IClockNeed, ILogable
+from aine_drl.drl_util import Clock, GraphedForward, IClockNeed, ILogable, normalize_obs
 import numpy as np
 import torch
 from enum import Enum
@@ -39,21 +39,25 @@ class Agent(ABC):
         self.network = network
         self.num_envs = num_envs
         self._behavior_type = BehaviorType.TRAIN
-        self.device = util.get_model_device(network)
+        # coerced once so every later placement hits the torch.device fast path
+        self.device = torch.device(util.get_model_device(network))
+        self._obs_pinned = None # persistent pinned staging buffer for H2D observation copies
+        self._graphed_inference_forward = None
 
         self.traced_env = 0
         self.cumulative_average_reward = util.IncrementalAverage()
-        self.cumulative_reward = 0.0
+        self.cumulative_reward = torch.zeros(num_envs)
         self.episode_average_len = util.IncrementalAverage()
+        self._episode_len = torch.zeros(num_envs)
         
-    def select_action(self, obs: np.ndarray) -> Action:
+    def select_action(self, obs: Union[np.ndarray, torch.Tensor]) -> Action:
         """
         Select action from the observation. 
         `batch_size` must be `num_envs` x `n_steps`. `n_steps` is generally 1. 
         It depends on `Agent.behavior_type` enum value.
 
         Args:
-            obs (ndarray): observation which is the input of neural network. shape must be `(batch_size, *obs_shape)`
+            obs (ndarray | Tensor): observation which is the input of neural network. shape must be `(batch_size, *obs_shape)`
 
         Returns:
             Action: selected action
@@ -61,13 +65,49 @@ class Agent(ABC):
         assert self.policy is not None, "You must call `Agent.set_policy()` method before it."
         
         if self.behavior_type == BehaviorType.TRAIN:
-            return self.select_action_train(torch.from_numpy(obs).to(device=self.device)).to_action()
+            return self.select_action_train(self._obs_to_tensor(obs)).to_action()
         elif self.behavior_type == BehaviorType.INFERENCE:
-            with torch.no_grad():
-                return self.select_action_inference(torch.from_numpy(obs).to(device=self.device)).to_action()
+            with torch.inference_mode():
+                if self._graphed_inference_forward is None:
+                    return self.select_action_inference(self._obs_to_tensor(obs)).to_action()
+                # temporarily route the network forward through the captured graph
+                original_forward = self.network.forward
+                self.network.forward = self._graphed_inference_forward
+                try:
+                    return self.select_action_inference(self._obs_to_tensor(obs)).to_action()
+                finally:
+                    self.network.forward = original_forward
         else:
             raise ValueError(f"Agent.behavior_type you currently use is invalid value. Your value is: {self.behavior_type}")
         
+    def enable_cuda_graph_inference(self):
+        """
+        Capture the network forward with CUDA Graphs for the inference path.
+        Since rollout inference runs thousands of times with a constant input shape,
+        replaying the captured graph removes nearly all per-step kernel launch overhead.
+        It only works when the network is on a CUDA device; otherwise it's a no-op.
+        """
+        if self.device.type == "cuda" and hasattr(torch.cuda, "CUDAGraph"):
+            self._graphed_inference_forward = GraphedForward(self.network.forward)
+
+    def _obs_to_tensor(self, obs: Union[np.ndarray, torch.Tensor]) -> torch.Tensor:
+        """
+        Convert the observation to a tensor on the network device.
+        On CUDA, it's staged through a persistent pinned buffer so the H2D copy overlaps with compute.
+        Tensor observations which already live on the network device (e.g. from GPU-side batched envs) pass through untouched.
+        """
+        if isinstance(obs, torch.Tensor):
+            if obs.device == self.device:
+                return normalize_obs(obs)
+            return normalize_obs(obs.to(device=self.device, non_blocking=True))
+        obs_tensor = torch.from_numpy(obs)
+        if self.device.type != "cuda":
+            return normalize_obs(obs_tensor.to(device=self.device))
+        if self._obs_pinned is None or self._obs_pinned.shape != obs_tensor.shape or self._obs_pinned.dtype != obs_tensor.dtype:
+            self._obs_pinned = torch.empty_like(obs_tensor, pin_memory=True)
+        self._obs_pinned.copy_(obs_tensor)
+        return normalize_obs(self._obs_pinned.to(device=self.device, non_blocking=True))
+
     def update(self, experience: Experience):
         """
         Update the agent. It stores data, trains the agent, etc.
@@ -80,14 +120,28 @@ class Agent(ABC):
         self._update_info(experience)
             
     def _update_info(self, experience: Experience):
-        self.clock.tick_gloabl_time_step()
-        self.cumulative_reward += experience.reward[self.traced_env].item()
-        # if the traced environment is terminated
-        if experience.terminated[self.traced_env] > 0.5:
-            self.cumulative_average_reward.update(self.cumulative_reward)
-            self.cumulative_reward = 0.0
-            self.episode_average_len.update(self.clock.episode_len)
-            self.clock.tick_episode()
+        self.clock.advance()
+        # coerce to host arrays once per step; per-element accesses on GPU-resident
+        # experiences would each force an implicit device synchronize
+        reward = torch.as_tensor(self._to_cpu_array(experience.reward)).flatten()
+        terminated = torch.as_tensor(self._to_cpu_array(experience.terminated)).flatten()
+        # one vectorized update for all environments instead of per-env Python accumulations
+        self.cumulative_reward += reward
+        self._episode_len += 1.0
+        terminated_mask = terminated > 0.5
+        if terminated_mask.any():
+            self.cumulative_average_reward.update_batch(self.cumulative_reward[terminated_mask])
+            self.episode_average_len.update_batch(self._episode_len[terminated_mask])
+            self.cumulative_reward.masked_fill_(terminated_mask, 0.0)
+            self._episode_len.masked_fill_(terminated_mask, 0.0)
+            # one tick for all terminated environments
+            self.clock.tick_episode(int(terminated_mask.sum()))
+
+    @staticmethod
+    def _to_cpu_array(field) -> np.ndarray:
+        if isinstance(field, torch.Tensor):
+            return field.detach().cpu().numpy()
+        return field
         
     @abstractmethod
     def select_action_train(self, obs: torch.Tensor) -> ActionTensor:
@@ -105,7 +159,7 @@ class Agent(ABC):
     @abstractmethod
     def select_action_inference(self, obs: torch.Tensor) -> ActionTensor:
         """
-        Select action when inference. It's automatically called with `torch.no_grad()`.
+        Select action when inference. It's automatically called with `torch.inference_mode()`.
 
         Args:
             obs (Tensor): observation tensor
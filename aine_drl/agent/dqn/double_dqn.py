@@ -107,7 +107,7 @@ class DoubleDQN(Agent):
         
     def select_action_train(self, obs: torch.Tensor) -> ActionTensor:
         # feed forward
-        pdparam = self.network.forward(obs)
+        pdparam = self.network(obs)
         
         # action sampling
         dist = self.policy.get_policy_distribution(pdparam)
@@ -116,7 +116,7 @@ class DoubleDQN(Agent):
         return action
     
     def select_action_inference(self, obs: torch.Tensor) -> ActionTensor:
-        pdparam = self.network.forward(obs)
+        pdparam = self.network(obs)
         dist = self.policy.get_policy_distribution(pdparam)
         return dist.sample()
     
@@ -146,12 +146,12 @@ class DoubleDQN(Agent):
     
     def compute_td_loss(self, exp_batch: DoubleDQNExperienceBatch) -> torch.Tensor:
         # Q values for all actions are from the Q network
-        q_values = self.network.forward(exp_batch.obs).discrete_pdparams
+        q_values = self.network(exp_batch.obs).discrete_pdparams
         with torch.no_grad():
             # next Q values for all actions are from the Q network
-            next_q_values = self.network.forward(exp_batch.next_obs).discrete_pdparams
+            next_q_values = self.network(exp_batch.next_obs).discrete_pdparams
             # next Q values for all actions are from the target network
-            next_q_target_values = self.target_network.forward(exp_batch.next_obs).discrete_pdparams
+            next_q_target_values = self.target_network(exp_batch.next_obs).discrete_pdparams
             
         actions = exp_batch.action.discrete_action.split(1, dim=1)
         
@@ -1,5 +1,6 @@
 from typing import NamedTuple, Optional
 from aine_drl.experience import Action, ActionTensor, Experience
+from aine_drl.drl_util.drl_util_methods import normalize_obs
 import aine_drl.util as util
 import numpy as np
 import torch
@@ -32,12 +33,14 @@ class DoubleDQNTrajectory:
         self.n_step = 0
         self._count = 0
         self._recent_idx = -1
-        
-        self.obs = [None] * self.capacity
-        self.action = [None] * self.capacity
-        self.reward = [None] * self.capacity
-        self.terminated = [None] * self.capacity
-        self.next_obs_buffer = [None] * self.num_envs
+
+        # SoA buffers are pre-allocated at the first add() call since the field shapes are unknown here
+        self.obs = None
+        self.discrete_action = None
+        self.continuous_action = None
+        self.reward = None
+        self.terminated = None
+        self.next_obs_buffer = None
         
     @property
     def can_train(self) -> bool:
@@ -54,34 +57,45 @@ class DoubleDQNTrajectory:
     def add(self, experience: Experience):
         num_envs = experience.obs.shape[0]
         assert self.num_envs == num_envs
-        
+
         self.n_step += 1
-        
-        discrete_action = np.split(experience.action.discrete_action, num_envs, axis=0)
-        continuous_action = np.split(experience.action.continuous_action, num_envs, axis=0)
-        action = [Action.create(d, c) for d, c in zip(discrete_action, continuous_action)]
-        
-        for i in range(num_envs):
-            self._recent_idx = (self._recent_idx + 1) % self.capacity
-            self._count = min(self._count + 1, self.capacity)
-            
-            self.obs[self._recent_idx] = experience.obs[i]
-            self.action[self._recent_idx] = action[i]
-            self.reward[self._recent_idx] = experience.reward[i]
-            self.terminated[self._recent_idx] = experience.terminated[i]
-            self.next_obs_buffer[i] = experience.next_obs[i]
+
+        if self.obs is None:
+            self._allocate(experience)
+
+        # all per-env ring writes collapse into fancy-indexed assignments
+        idxs = (self._recent_idx + 1 + np.arange(num_envs)) % self.capacity
+        self._recent_idx = int(idxs[-1])
+        self._count = min(self._count + num_envs, self.capacity)
+
+        self.obs[idxs] = experience.obs
+        self.discrete_action[idxs] = experience.action.discrete_action
+        self.continuous_action[idxs] = experience.action.continuous_action
+        self.reward[idxs] = experience.reward
+        self.terminated[idxs] = experience.terminated
+        np.copyto(self.next_obs_buffer, experience.next_obs)
+
+    def _allocate(self, experience: Experience):
+        def empty(field: np.ndarray) -> np.ndarray:
+            return np.empty((self.capacity,) + field.shape[1:], dtype=field.dtype)
+
+        self.obs = empty(experience.obs)
+        self.discrete_action = empty(experience.action.discrete_action)
+        self.continuous_action = empty(experience.action.continuous_action)
+        self.reward = empty(experience.reward)
+        self.terminated = empty(experience.terminated)
+        self.next_obs_buffer = np.empty_like(experience.next_obs)
         
     def sample(self, device: Optional[torch.device] = None) -> DoubleDQNExperienceBatch:
         self.n_step = 0
         sample_idx = self._sample_idxs()
-        
-        actions = util.get_batch_list(self.action, sample_idx)
-        action = Action.to_batch(actions).to_action_tensor(device)
-        
+
+        action = Action(self.discrete_action[sample_idx], self.continuous_action[sample_idx]).to_action_tensor(device)
+
         experience_batch = DoubleDQNExperienceBatch(
-            self._get_batch_tensor(self.obs, sample_idx, device),
+            normalize_obs(self._get_batch_tensor(self.obs, sample_idx, device)),
             action,
-            torch.from_numpy(self._sample_next_obs(sample_idx)).to(device=device),
+            normalize_obs(torch.from_numpy(self._sample_next_obs(sample_idx)).to(device=device)),
             self._get_batch_tensor(self.reward, sample_idx, device).unsqueeze_(-1),
             self._get_batch_tensor(self.terminated, sample_idx, device).unsqueeze_(-1),
             n_steps=self.batch_size
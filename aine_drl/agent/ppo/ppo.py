@@ -131,20 +131,21 @@ class PPO(Agent):
     def select_action_train(self, obs: torch.Tensor) -> ActionTensor:
         with torch.no_grad():
             # feed forward 
-            pdparam, v_pred = self.network.forward(obs)
+            pdparam, v_pred = self.network(obs)
             
             # action sampling
             dist = self.policy.get_policy_distribution(pdparam)
             action = dist.sample()
             
-            # store data
-            self.current_action_log_prob = dist.log_prob(action).cpu()
-            self.v_pred = v_pred.cpu()
+            # store data on the inference device; the trajectory buffers follow it,
+            # so the rollout never round-trips through the host
+            self.current_action_log_prob = dist.log_prob(action)
+            self.v_pred = v_pred
             
             return action
     
     def select_action_inference(self, obs: torch.Tensor) -> ActionTensor:
-        pdparam, _ = self.network.forward(obs)
+        pdparam, _ = self.network(obs)
         dist = self.policy.get_policy_distribution(pdparam)
         return dist.sample()
             
@@ -157,36 +158,83 @@ class PPO(Agent):
         
         for _ in range(self.config.epoch):
             sample_idxes = torch.randperm(batch_size)
-            for i in range(batch_size // self.config.mini_batch_size):
-                sample_idx = sample_idxes[self.config.mini_batch_size * i : self.config.mini_batch_size * (i + 1)]
-                
+            for minibatch in self._prefetch_minibatches(exp_batch, old_action_log_prob, advantage, v_target, sample_idxes):
+                mini_obs, mini_action, mini_old_action_log_prob, mini_advantage, mini_v_target = minibatch
+
                 # feed forward
-                pdparam, v_pred = self.network.forward(exp_batch.obs[sample_idx])
-                
+                pdparam, v_pred = self.network(mini_obs)
+
                 # compute actor loss
                 dist = self.policy.get_policy_distribution(pdparam)
-                new_action_log_prob = dist.log_prob(exp_batch.action.slice(sample_idx))
+                new_action_log_prob = dist.log_prob(mini_action)
                 actor_loss = PPO.compute_actor_loss(
-                    advantage[sample_idx],
-                    old_action_log_prob[sample_idx],
+                    mini_advantage,
+                    mini_old_action_log_prob,
                     new_action_log_prob,
                     self.config.epsilon_clip
                 )
                 entropy = dist.entropy().mean()
-                
+
                 # compute critic loss
-                critic_loss = PPO.compute_critic_loss(v_pred, v_target[sample_idx])
-                
+                critic_loss = PPO.compute_critic_loss(v_pred, mini_v_target)
+
                 # train step
                 loss = actor_loss + self.config.value_loss_coef * critic_loss - self.config.entropy_coef * entropy
                 self.network.train_step(loss, self.config.grad_clip_max_norm, self.clock.training_step)
-                
+
                 self.clock.tick_training_step()
-                
+
             # log data
             self.actor_average_loss.update(actor_loss.item())
             self.critic_average_loss.update(critic_loss.item())
 
+    def _prefetch_minibatches(self,
+                              exp_batch: PPOExperienceBatch,
+                              old_action_log_prob: torch.Tensor,
+                              advantage: torch.Tensor,
+                              v_target: torch.Tensor,
+                              sample_idxes: torch.Tensor):
+        """
+        Yields minibatches of (obs, action, old_action_log_prob, advantage, v_target).
+        On CUDA, the next minibatch is gathered on a side stream while the current one trains,
+        hiding the gather latency behind the backward pass.
+        """
+        mini_batch_size = self.config.mini_batch_size
+        num_minibatches = len(sample_idxes) // mini_batch_size
+
+        def gather(i: int) -> tuple:
+            sample_idx = sample_idxes[mini_batch_size * i : mini_batch_size * (i + 1)]
+            return (
+                exp_batch.obs[sample_idx],
+                exp_batch.action.slice(sample_idx),
+                old_action_log_prob[sample_idx],
+                advantage[sample_idx],
+                v_target[sample_idx]
+            )
+
+        if self.device.type != "cuda":
+            for i in range(num_minibatches):
+                yield gather(i)
+            return
+
+        prefetch_stream = torch.cuda.Stream()
+        # the gathered tensors were produced on the main stream, so the side stream must wait for them
+        prefetch_stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(prefetch_stream):
+            staged = gather(0)
+        for i in range(num_minibatches):
+            # the gathers issued on the side stream must complete before use on the main stream
+            torch.cuda.current_stream().wait_stream(prefetch_stream)
+            current = staged
+            if i + 1 < num_minibatches:
+                with torch.cuda.stream(prefetch_stream):
+                    staged = gather(i + 1)
+            mini_obs, mini_action, *rest = current
+            # the staged tensors were allocated on the side stream but are consumed on the main one
+            for tensor in (mini_obs, *mini_action, *rest):
+                tensor.record_stream(torch.cuda.current_stream())
+            yield current
+
         
     def compute_adavantage_v_target(self, exp_batch: PPOExperienceBatch) -> Tuple[torch.Tensor, torch.Tensor]:
         """
@@ -200,7 +248,7 @@ class PPO(Agent):
         """
         with torch.no_grad():
             final_next_obs = exp_batch.next_obs[-self.num_envs:]
-            _, final_next_v_pred = self.network.forward(final_next_obs)
+            _, final_next_v_pred = self.network(final_next_obs)
         
         v_pred = torch.cat([exp_batch.v_pred, final_next_v_pred])
         
@@ -26,28 +26,35 @@ class PPOTrajectory:
         
     def reset(self):
         self.exp_trajectory.reset()
-        
-        self.action_log_prob = [None] * self.max_n_steps
-        self.v_pred = [None] * self.max_n_steps
-        
-    def add(self, 
+
+        # pre-allocated at the first add() call since the shapes are unknown here,
+        # then kept across resets
+        if not hasattr(self, "action_log_prob"):
+            self.action_log_prob = None
+            self.v_pred = None
+
+    def add(self,
             experience: Experience,
             action_log_prob: torch.Tensor,
             v_pred: torch.Tensor):
         self.exp_trajectory.add(experience)
+        if self.action_log_prob is None:
+            self.action_log_prob = torch.empty((self.max_n_steps,) + action_log_prob.shape, dtype=action_log_prob.dtype, device=action_log_prob.device)
+            self.v_pred = torch.empty((self.max_n_steps,) + v_pred.shape, dtype=v_pred.dtype, device=v_pred.device)
         self.action_log_prob[self.exp_trajectory.recent_idx] = action_log_prob
         self.v_pred[self.exp_trajectory.recent_idx] = v_pred
-        
+
     def sample(self, device: Optional[torch.device] = None) -> PPOExperienceBatch:
         exp_batch = self.exp_trajectory.sample(device)
+        count = exp_batch.n_steps
         exp_batch = PPOExperienceBatch(
             exp_batch.obs,
             exp_batch.action,
             exp_batch.next_obs,
             exp_batch.reward,
             exp_batch.terminated,
-            torch.cat(self.action_log_prob, dim=0).to(device=device),
-            torch.cat(self.v_pred, dim=0).to(device=device),
+            self.action_log_prob[:count].flatten(0, 1).to(device=device),
+            self.v_pred[:count].flatten(0, 1).to(device=device),
             exp_batch.n_steps
         )
         self.reset()
@@ -104,7 +104,7 @@ class REINFORCE(Agent):
             
     def select_action_train(self, obs: torch.Tensor) -> ActionTensor:
         # feed forward 
-        pdparam = self.network.forward(obs)
+        pdparam = self.network(obs)
         
         # action sampling
         dist = self.policy.get_policy_distribution(pdparam)
@@ -117,7 +117,7 @@ class REINFORCE(Agent):
         return action
     
     def select_action_inference(self, obs: torch.Tensor) -> ActionTensor:
-        pdparam = self.network.forward(obs)
+        pdparam = self.network(obs)
         dist = self.policy.get_policy_distribution(pdparam)
         return dist.sample()
             
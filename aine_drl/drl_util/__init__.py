@@ -2,4 +2,5 @@ from .drl_util_methods import *
 from .decay import *
 from .epsilon_greedy import *
 from .clock import *
+from .cuda_graph import *
 from .net_spec import *
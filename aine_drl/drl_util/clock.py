@@ -40,14 +40,21 @@ class Clock:
     def real_time(self) -> float:
         return self._real_time
     
-    def tick_gloabl_time_step(self):
-        self._episode_len += 1
-        self._global_time_step += self.num_envs
+    def advance(self, n_steps: int = 1):
+        """
+        Advance the time by `n_steps` time steps in a single call.
+        It considers multiple environments, so the global time step increases by `n_steps` x `num_envs`.
+        """
+        self._episode_len += n_steps
+        self._global_time_step += n_steps * self.num_envs
         self._real_time = self._get_real_time()
-        
-    def tick_episode(self):
+
+    def tick_gloabl_time_step(self):
+        self.advance()
+
+    def tick_episode(self, count: int = 1):
         self._episode_len = 0
-        self._episode += 1
+        self._episode += count
         
     def tick_training_step(self):
         self._training_step += 1
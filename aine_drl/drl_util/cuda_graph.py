@@ -0,0 +1,47 @@
+from typing import Callable
+import torch
+
+class GraphedForward:
+    """
+    CUDA Graphs wrapper of a forward function for fixed-shape inputs.
+    The forward is captured once at the first call.
+    Every following call just copies the input into the static buffer and replays the graph,
+    which eliminates the per-kernel launch overhead of small-batch rollout inference.
+    Inputs whose shape differs from the captured one fall back to the original forward.
+
+    Args:
+        forward_fn (Callable): forward function whose input is a fixed-shape tensor
+        num_warmups (int, optional): warmup iterations before the capture. Defaults to 3.
+    """
+    def __init__(self, forward_fn: Callable, num_warmups: int = 3) -> None:
+        self.forward_fn = forward_fn
+        self.num_warmups = num_warmups
+        self.graph = None
+        self.static_input = None
+        self.static_output = None
+
+    def __call__(self, obs: torch.Tensor):
+        if self.graph is None:
+            return self._capture(obs)
+        if obs.shape != self.static_input.shape:
+            return self.forward_fn(obs)
+        self.static_input.copy_(obs)
+        self.graph.replay()
+        return self.static_output
+
+    def _capture(self, obs: torch.Tensor):
+        self.static_input = obs.clone()
+        # warm up on a side stream so lazy initializations settle before the capture
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(self.num_warmups):
+                self.forward_fn(self.static_input)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        self.graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(self.graph):
+            self.static_output = self.forward_fn(self.static_input)
+        # capture only records the kernels, so replay once to actually fill static_output
+        self.graph.replay()
+        return self.static_output
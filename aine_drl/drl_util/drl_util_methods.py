@@ -23,6 +23,14 @@ def perenv2batch(batch_tensor: torch.Tensor) -> torch.Tensor:
         shape = (-1,) + shape[2:]
         return batch_tensor.transpose(0, 1).reshape(shape)
 
+def normalize_obs(obs: torch.Tensor) -> torch.Tensor:
+    """
+    Normalize uint8 (pixel) observations to float32 in [0, 1]. Float observations pass through.
+    """
+    if obs.dtype == torch.uint8:
+        return obs.to(torch.float32).div_(255.0)
+    return obs
+
 def copy_network(src_net: nn.Module, target_net: nn.Module):
     """
     Copy model weights from src to target.
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, Tuple, Union, Any
 from aine_drl.policy.policy_distribution import PolicyDistributionParameter
+import aine_drl.util as util
 import torch
 import torch.nn as nn
 import torch.nn.functional as F
@@ -13,14 +14,16 @@ class DiscreteActionLayer(nn.Module):
         in_features (int): number of input features
         num_discrete_actions (int | Tuple[int, ...]): each element indicates number of discrete actions of each branch
         is_logits (bool): whether logits or probabilities. Defaults to logits.
+        compile_forward (bool): whether to fuse the forward pass with `torch.compile`. Defaults to False.
     """
 
-    def __init__(self, in_features: int, 
-                 num_discrete_actions: Union[int, Tuple[int, ...]], 
+    def __init__(self, in_features: int,
+                 num_discrete_actions: Union[int, Tuple[int, ...]],
                  is_logits: bool = True,
                  bias: bool = True,
                  device: Optional[torch.device] = None,
-                 dtype: Optional[Any] = None) -> None:
+                 dtype: Optional[Any] = None,
+                 compile_forward: bool = False) -> None:
         """
         Linear layer for the discrete action type.
 
@@ -28,6 +31,7 @@ class DiscreteActionLayer(nn.Module):
             in_features (int): number of input features
             num_discrete_actions (int | Tuple[int, ...]): each element indicates number of discrete actions of each branch
             is_logits (bool): whether logits or probabilities. Defaults to logits.
+            compile_forward (bool): whether to fuse the forward pass with `torch.compile`. Defaults to False.
         """
         super().__init__()
         
@@ -36,7 +40,9 @@ class DiscreteActionLayer(nn.Module):
         if type(num_discrete_actions) is int:
             num_discrete_actions = (num_discrete_actions,)
         self.num_discrete_actions = num_discrete_actions
-        
+        # when all branches have the same action count, per-branch ops can run as one batched kernel
+        self._uniform_branches = len(set(num_discrete_actions)) == 1
+
         self.total_num_discrete_actions = 0
         for num_action in num_discrete_actions:
             self.total_num_discrete_actions += num_action
@@ -48,15 +54,28 @@ class DiscreteActionLayer(nn.Module):
             device,
             dtype
         )
-    
+
+        if compile_forward and hasattr(torch, "compile"):
+            # fuses linear + split + softmax into fewer kernel launches
+            self.forward = torch.compile(self.forward, mode="reduce-overhead")
+
     def forward(self, x: torch.Tensor) -> PolicyDistributionParameter:
         out = self.layer(x)
+
+        if self._uniform_branches:
+            # per-branch params become zero-copy views over one (batch_size, num_branches, num_actions) tensor
+            out = out.view(-1, len(self.num_discrete_actions), self.num_discrete_actions[0])
+            if not self.is_logits:
+                # single softmax over all branches instead of one kernel per branch
+                out = F.softmax(out, dim=-1)
+            return PolicyDistributionParameter.create(discrete_pdparams=out)
+
         discrete_pdparams = list(torch.split(out, self.num_discrete_actions, dim=1))
-        
+
         if not self.is_logits:
             for i in range(len(discrete_pdparams)):
                 discrete_pdparams[i] = F.softmax(discrete_pdparams[i], dim=1)
-        
+
         return PolicyDistributionParameter.create(discrete_pdparams=discrete_pdparams)
     
 class GaussianContinuousActionLayer(nn.Module):
@@ -66,24 +85,27 @@ class GaussianContinuousActionLayer(nn.Module):
     Args:
         in_features (int): number of input features
         num_continuous_actions (int): number of continuous actions which equals to `num_continuous_branches`
+        compile_forward (bool): whether to fuse the forward pass with `torch.compile`. Defaults to False.
     """
-    
-    def __init__(self, in_features: int, 
-                 num_continuous_actions: int, 
+
+    def __init__(self, in_features: int,
+                 num_continuous_actions: int,
                  bias: bool = True,
                  device: Optional[torch.device] = None,
-                 dtype: Optional[Any] = None) -> None:
+                 dtype: Optional[Any] = None,
+                 compile_forward: bool = False) -> None:
         """
         Linear layer for the continuous action type.
 
         Args:
             in_features (int): number of input features
             num_continuous_actions (int): number of continuous actions which equals to `num_continuous_branches`
+            compile_forward (bool): whether to fuse the forward pass with `torch.compile`. Defaults to False.
         """
         super().__init__()
-        
+
         self.num_continuous_actions = num_continuous_actions
-        
+
         self.layer = nn.Linear(
             in_features,
             self.num_continuous_actions * 2,
@@ -91,22 +113,55 @@ class GaussianContinuousActionLayer(nn.Module):
             device,
             dtype
         )
-        
+
+        if compile_forward and hasattr(torch, "compile"):
+            # fuses linear + view + abs into fewer kernel launches
+            self.forward = torch.compile(self.forward, mode="reduce-overhead")
+
     def forward(self, x: torch.Tensor) -> PolicyDistributionParameter:
-        out = self.layer(x)
-        out = torch.reshape(out, (-1, self.num_continuous_actions, 2))
-        torch.abs_(out[..., 1])
-        out = torch.reshape(out, (-1, self.num_continuous_actions * 2))
-        continuous_pdparams = list(torch.split(out, 2, dim=1))
-        return PolicyDistributionParameter.create(continuous_pdparams=continuous_pdparams)
+        out = self.layer(x).view(-1, self.num_continuous_actions, 2)
+        mean, std = out.unbind(dim=-1)
+        # out-of-place abs keeps the autograd graph fusable, unlike the previous in-place variant
+        pdparam = torch.stack((mean, std.abs()), dim=-1)
+        return PolicyDistributionParameter.create(continuous_pdparams=pdparam)
     
 class Network(nn.Module, ABC):
     """
     AINE-DRL network abstract class.
     """
-    
+
+    def make_distributed(self, local_rank: Optional[int] = None) -> "Network":
+        """
+        Wrap the network with `DistributedDataParallel` for the multi-GPU training.
+        Gradients are all-reduced asynchronously during `loss.backward()`,
+        so it overlaps communication with computation.
+        You must initialize the default process group before calling it.
+
+        Args:
+            local_rank (int | None, optional): local device rank. Defaults to the current device of the parameters.
+
+        Returns:
+            Network: self
+        """
+        from torch.nn.parallel import DistributedDataParallel
+        device_ids = None if local_rank is None else [local_rank]
+        # stored outside of the module registry since it would register the network as its own submodule
+        self.__dict__["_ddp"] = DistributedDataParallel(self, device_ids=device_ids)
+        return self
+
+    def __call__(self, *args, **kwargs):
+        # route through the DDP wrapper so the autograd graph triggers the all-reduce hooks
+        ddp = self.__dict__.get("_ddp", None)
+        if ddp is not None and not self.__dict__.get("_in_ddp_forward", False):
+            self.__dict__["_in_ddp_forward"] = True
+            try:
+                return ddp(*args, **kwargs)
+            finally:
+                self.__dict__["_in_ddp_forward"] = False
+        return super().__call__(*args, **kwargs)
+
     @abstractmethod
-    def train_step(self, 
+    def train_step(self,
                    loss: torch.Tensor,
                    grad_clip_max_norm: Optional[float],
                    training_step: int):
@@ -124,10 +179,12 @@ class Network(nn.Module, ABC):
                           loss: torch.Tensor,
                           optimizer: torch.optim.Optimizer,
                           grad_clip_max_norm: Optional[float]):
-        optimizer.zero_grad()
+        # set_to_none skips the memset over every gradient tensor
+        optimizer.zero_grad(set_to_none=True)
         loss.backward()
         if grad_clip_max_norm is not None:
-            torch.nn.utils.clip_grad_norm_(self.parameters(), grad_clip_max_norm)
+            # fused multi-tensor clipping when the installed torch supports it
+            util.clip_grad_norm(self.parameters(), grad_clip_max_norm)
         optimizer.step()
     
 class PolicyGradientNetwork(Network):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import NamedTuple, List, Optional
+from typing import NamedTuple, List, Optional, Union
 from aine_drl.experience import ActionTensor
 import torch
 from torch.distributions import Categorical, Normal
@@ -35,13 +35,23 @@ class PolicyDistributionParameter(NamedTuple):
         return self.num_discrete_branches + self.num_continuous_branches
     
     @staticmethod
-    def create(discrete_pdparams: Optional[List[torch.Tensor]] = None,
-               continuous_pdparams: Optional[List[torch.Tensor]] = None) -> "PolicyDistributionParameter":
+    def create(discrete_pdparams: Union[List[torch.Tensor], torch.Tensor, None] = None,
+               continuous_pdparams: Union[List[torch.Tensor], torch.Tensor, None] = None) -> "PolicyDistributionParameter":
+        """
+        Helps to instantiate `PolicyDistributionParameter`.
+        Each parameter is either a list of per-branch tensors or a single stacked tensor
+        whose shape is `(batch_size, num_branches, *pdparam_shape)`,
+        which is unbound into zero-copy per-branch views.
+        """
         if discrete_pdparams is None:
             discrete_pdparams = []
+        elif isinstance(discrete_pdparams, torch.Tensor):
+            discrete_pdparams = list(discrete_pdparams.unbind(dim=1))
         if continuous_pdparams is None:
             continuous_pdparams = []
-        
+        elif isinstance(continuous_pdparams, torch.Tensor):
+            continuous_pdparams = list(continuous_pdparams.unbind(dim=1))
+
         return PolicyDistributionParameter(discrete_pdparams, continuous_pdparams)
 
 
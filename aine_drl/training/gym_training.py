@@ -101,6 +101,7 @@ class GymTraining:
         
             {'num_envs': 3,
              'Gym': {'env': {'id': 'CartPole-v1'},
+              'asynchronous': True,
               'training': {'seed': 0,
                'auto_retrain': True,
                'total_global_time_steps': 200000,
@@ -115,6 +116,7 @@ class GymTraining:
             Gym:
               env:
                 id: "CartPole-v1"
+              asynchronous: true
               training:
                 seed: 0
                 auto_retrain: false
@@ -126,14 +128,17 @@ class GymTraining:
         """
         
         num_envs = env_config["num_envs"]
-        gym_config = env_config["Gym"]        
+        gym_config = env_config["Gym"]
         if gym_env is None:
             gym_env_config = gym_config["env"]
             if num_envs > 1:
-                gym_env = gym.vector.make(num_envs=num_envs, new_step_api=True, **gym_env_config)
+                # asynchronous option steps the environments in worker processes (AsyncVectorEnv),
+                # otherwise they are stepped serially in the driver process (SyncVectorEnv)
+                asynchronous = gym_config.get("asynchronous", True)
+                gym_env = gym.vector.make(num_envs=num_envs, new_step_api=True, asynchronous=asynchronous, **gym_env_config)
             else:
                 gym_env = gym.make(new_step_api=True, **gym_env_config)
-                            
+
         training_config = gym_config["training"]
         
         seed = training_config.get("seed", None)
@@ -210,14 +215,14 @@ class GymTraining:
         agent.behavior_type = BehaviorType.INFERENCE
         for _ in range(num_episodes):
             # (num_envs, *obs_shape) = (1, *obs_shape)
-            obs = self.inference_gym_env.reset(seed=self.seed).astype(self.dtype)[np.newaxis, ...]
+            obs = self._to_obs_array(self.inference_gym_env.reset(seed=self.seed))[np.newaxis, ...]
             terminated = False
             cumulative_reward = 0.0
             while not terminated:
                 action = agent.select_action(obs)
                 next_obs, reward, teraminted, truncated, _ = self.inference_gym_env.step(self.inference_gym_action_communicator.to_gym_action(action))
                 terminated = teraminted | truncated
-                obs = next_obs.astype(self.dtype)[np.newaxis, ...]
+                obs = self._to_obs_array(next_obs)[np.newaxis, ...]
                 cumulative_reward += reward
             logger.print(f"inference mode - global time step {agent.clock.global_time_step}, cumulative reward: {cumulative_reward}")
             
@@ -230,7 +235,7 @@ class GymTraining:
         
     def _train(self, agent: Agent, total_gloabl_time_steps: int):
         gym_env = self.gym_env
-        obs = gym_env.reset(seed=self.seed).astype(self.dtype)
+        obs = self._to_obs_array(gym_env.reset(seed=self.seed))
         if not self.is_vector_env:
             # (num_envs, *obs_shape) = (1, *obs_shape)
             obs = obs[np.newaxis, ...]
@@ -253,7 +258,7 @@ class GymTraining:
             
             # update current observation
             if not self.is_vector_env and terminated:
-                obs = gym_env.reset(seed=self.seed).astype(self.dtype)[np.newaxis, ...]
+                obs = self._to_obs_array(gym_env.reset(seed=self.seed))[np.newaxis, ...]
             else:
                 obs = exp.next_obs
                 
@@ -308,20 +313,29 @@ class GymTraining:
         for key, value in log_data.items():
             logger.log(key, value[0], value[1])
                 
+    def _to_obs_array(self, obs) -> np.ndarray:
+        # uint8 (pixel) observations keep their native dtype so buffers store 1 byte per element;
+        # they are normalized to float at consumption time
+        obs = np.asarray(obs)
+        if obs.dtype == np.uint8:
+            return obs
+        return np.asarray(obs, dtype=self.dtype)
+
     def _make_experience(self, obs, action, next_obs, reward, terminated) -> Experience:
         if self.is_vector_env:
+            # np.asarray avoids a copy per field when the dtype already matches
             exp = Experience(
-                obs.astype(np.float32),
+                self._to_obs_array(obs),
                 action,
-                next_obs.astype(np.float32),
-                reward.astype(np.float32),
-                terminated.astype(np.float32)
+                self._to_obs_array(next_obs),
+                np.asarray(reward, dtype=np.float32),
+                np.asarray(terminated, dtype=np.float32)
             )
         else:
             exp = Experience(
-                obs.astype(np.float32),
+                self._to_obs_array(obs),
                 action,
-                next_obs[np.newaxis, ...].astype(np.float32),
+                self._to_obs_array(next_obs)[np.newaxis, ...],
                 np.array([[reward]], dtype=np.float32),
                 np.array([[terminated]], dtype=np.float32)
             )
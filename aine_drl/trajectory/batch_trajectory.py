@@ -1,55 +1,102 @@
 from typing import Optional
 from aine_drl.experience import Action, Experience, ExperienceBatchTensor
+from aine_drl.drl_util.drl_util_methods import normalize_obs
+import os
+import tempfile
 import torch
 import numpy as np
 
 class BatchTrajectory:
     """
     It's a trajectory utility of experience batch for the batch learning.
-    
+    Experiences are stored in pre-allocated structure-of-arrays (SoA) ring buffers,
+    so adding an experience is a single vectorized write instead of Python list stores.
+
     Args:
         max_n_steps (int): maximum number of time steps to be stored
+        memmap_dir (str | None, optional): when set, the SoA buffers are backed by
+            memory-mapped files in this directory, so large buffers spill to disk
+            without degrading random indexing. Defaults to in-memory buffers.
     """
-    def __init__(self, max_n_steps: int) -> None:
+    def __init__(self, max_n_steps: int, memmap_dir: Optional[str] = None) -> None:
         self.max_n_steps = max_n_steps
+        self.memmap_dir = memmap_dir
         self.reset()
-        
+
     @property
     def count(self) -> int:
         return self._count
-    
+
     @property
     def recent_idx(self) -> int:
         return self._recent_idx
-        
+
     def reset(self):
         self._count = 0
         self._recent_idx = -1
-        
-        self.obs = [None] * self.max_n_steps
-        self.action = [None] * self.max_n_steps
-        self.reward = [None] * self.max_n_steps
-        self.terminated = [None] * self.max_n_steps
-        self.next_obs_buffer = None # most recently added next state
-        
+
+        # SoA buffers are lazily allocated at the first add() call
+        # since the field shapes are unknown until an experience arrives,
+        # then kept across resets
+        if not hasattr(self, "obs"):
+            self.obs = None
+            self.discrete_action = None
+            self.continuous_action = None
+            self.reward = None
+            self.terminated = None
+
     def add(self, experience: Experience):
+        if self.obs is None:
+            self._allocate(experience)
+
         self._recent_idx = (self._recent_idx + 1) % self.max_n_steps
         self._count = min(self._count + 1, self.max_n_steps)
-        
-        self.obs[self._recent_idx] = experience.obs
-        self.action[self._recent_idx] = experience.action
-        self.reward[self._recent_idx] = experience.reward
-        self.terminated[self._recent_idx] = experience.terminated
-        self.next_obs_buffer = experience.next_obs
-    
+
+        idx = self._recent_idx
+        self.obs[idx] = experience.obs
+        # next_obs of the current time step shares storage with obs of the next time step
+        self.obs[idx + 1] = experience.next_obs
+        self.discrete_action[idx] = experience.action.discrete_action
+        self.continuous_action[idx] = experience.action.continuous_action
+        self.reward[idx] = experience.reward
+        self.terminated[idx] = experience.terminated
+
     def sample(self, device: Optional[torch.device] = None) -> ExperienceBatchTensor:
-        self.obs.append(self.next_obs_buffer)
+        count = self._count
+        action = Action(
+            self._flatten(self.discrete_action[:count]),
+            self._flatten(self.continuous_action[:count]),
+        )
         exp_batch = ExperienceBatchTensor(
-            torch.from_numpy(np.concatenate(self.obs[:-1], axis=0)).to(device=device),
-            Action.to_batch(self.action).to_action_tensor(device),
-            torch.from_numpy(np.concatenate(self.obs[1:], axis=0)).to(device=device),
-            torch.from_numpy(np.concatenate(self.reward, axis=0)).to(device=device),
-            torch.from_numpy(np.concatenate(self.terminated, axis=0)).to(device=device),
-            self.count
+            normalize_obs(torch.from_numpy(self._flatten(self.obs[:count])).to(device=device)),
+            action.to_action_tensor(device),
+            normalize_obs(torch.from_numpy(self._flatten(self.obs[1:count + 1])).to(device=device)),
+            torch.from_numpy(self._flatten(self.reward[:count])).to(device=device),
+            torch.from_numpy(self._flatten(self.terminated[:count])).to(device=device),
+            count
         )
-        return exp_batch
\ No newline at end of file
+        return exp_batch
+
+    def _allocate(self, experience: Experience):
+        def empty(field: np.ndarray) -> np.ndarray:
+            return self._empty_buffer((self.max_n_steps,) + field.shape, field.dtype)
+
+        # the extra obs row stores the most recently added next_obs
+        self.obs = self._empty_buffer((self.max_n_steps + 1,) + experience.obs.shape, experience.obs.dtype)
+        self.discrete_action = empty(experience.action.discrete_action)
+        self.continuous_action = empty(experience.action.continuous_action)
+        self.reward = empty(experience.reward)
+        self.terminated = empty(experience.terminated)
+
+    def _empty_buffer(self, shape: tuple, dtype) -> np.ndarray:
+        if self.memmap_dir is None:
+            return np.empty(shape, dtype=dtype)
+        os.makedirs(self.memmap_dir, exist_ok=True)
+        fd, file_name = tempfile.mkstemp(suffix=".dat", dir=self.memmap_dir)
+        os.close(fd)
+        return np.memmap(file_name, dtype=dtype, mode="w+", shape=shape)
+
+    @staticmethod
+    def _flatten(arr: np.ndarray) -> np.ndarray:
+        """(n_steps, num_envs, *shape) -> (n_steps * num_envs, *shape)"""
+        return arr.reshape((arr.shape[0] * arr.shape[1],) + arr.shape[2:])
@@ -1,5 +1,6 @@
 from typing import Optional
 from aine_drl.experience import Action, Experience, ExperienceBatchTensor
+from aine_drl.drl_util.drl_util_methods import normalize_obs
 import torch
 import numpy as np
 
@@ -39,9 +40,9 @@ class MonteCarloTrajectory:
     def sample(self, device: Optional[torch.device] = None) -> ExperienceBatchTensor:
         self.obs.append(self.next_obs_buffer)
         exp_batch = ExperienceBatchTensor(
-            torch.from_numpy(np.concatenate(self.obs[:-1], axis=0)).to(device=device),
+            normalize_obs(torch.from_numpy(np.concatenate(self.obs[:-1], axis=0)).to(device=device)),
             Action.to_batch(self.action).to_action_tensor(device),
-            torch.from_numpy(np.concatenate(self.obs[1:], axis=0)).to(device=device),
+            normalize_obs(torch.from_numpy(np.concatenate(self.obs[1:], axis=0)).to(device=device)),
             torch.from_numpy(np.concatenate(self.reward, axis=0)).to(device=device),
             torch.from_numpy(np.concatenate(self.terminated, axis=0)).to(device=device),
             self.count
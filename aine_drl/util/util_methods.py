@@ -1,3 +1,4 @@
+import inspect
 import operator
 from typing import Union
 import numpy as np
@@ -9,6 +10,9 @@ import torch.nn.utils as torch_util
 import torch.backends.cudnn as cudnn
 import random
 
+# older torch versions don't have the fused multi-tensor path of clip_grad_norm_
+_clip_grad_norm_supports_foreach = "foreach" in inspect.signature(torch_util.clip_grad_norm_).parameters
+
 _random_seed = None
 
 def seed(value: int):
@@ -142,15 +146,24 @@ def vector_env_unpack(batch_tensor: torch.Tensor) -> torch.Tensor:
 def get_optim_params(optimizer: torch.optim.Optimizer):
     return [param["params"] for param in optimizer.param_groups]
 
-def train_step(loss: torch.Tensor, 
-               optimizer: torch.optim.Optimizer, 
-               lr_scheduler = None, 
+def clip_grad_norm(parameters, max_norm: float) -> torch.Tensor:
+    """
+    Clip the gradient norm of the parameters with the fused multi-tensor (`foreach`) path when available,
+    which runs one kernel across all gradients instead of one per parameter tensor.
+    """
+    if _clip_grad_norm_supports_foreach:
+        return torch_util.clip_grad_norm_(parameters, max_norm, foreach=True)
+    return torch_util.clip_grad_norm_(parameters, max_norm)
+
+def train_step(loss: torch.Tensor,
+               optimizer: torch.optim.Optimizer,
+               lr_scheduler = None,
                grad_clip_max_norm: Union[float, None] = None,
                epoch: int = -1):
-    optimizer.zero_grad()
+    optimizer.zero_grad(set_to_none=True)
     loss.backward()
     if grad_clip_max_norm is not None:
-        torch_util.clip_grad_norm_(*get_optim_params(optimizer), grad_clip_max_norm)
+        clip_grad_norm(*get_optim_params(optimizer), grad_clip_max_norm)
     optimizer.step()
     lr_scheduler_step(lr_scheduler, epoch)
     
@@ -174,6 +187,16 @@ class IncrementalAverage:
         self.n += 1
         self._average = self._average + (value - self._average) / self.n
         return self._average
+
+    def update_batch(self, values):
+        """Update current average with a batch of values at once."""
+        values = np.asarray(values)
+        batch_count = values.size
+        if batch_count == 0:
+            return self._average
+        self.n += batch_count
+        self._average = self._average + (float(values.sum()) - batch_count * self._average) / self.n
+        return self._average
         
     @property
     def average(self):